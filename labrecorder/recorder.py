@@ -2,6 +2,7 @@
 Main Lab Recorder class.
 """
 
+import os
 import time
 import threading
 import pylsl
@@ -37,6 +38,8 @@ class LabRecorder:
         # Recording state
         self.filename = filename
         self.is_recording_flag = False
+        self.recording_stopped = threading.Event()  # set whenever no recording is in progress
+        self.recording_stopped.set()
         self.xdf_writer: Optional[SimpleXDFWriter] = None
         
         # Stream management
@@ -115,7 +118,6 @@ class LabRecorder:
 
         # Ensure output directory exists
         try:
-            import os
             out_dir = os.path.dirname(self.filename)
             if out_dir and not os.path.isdir(out_dir):
                 os.makedirs(out_dir, exist_ok=True)
@@ -134,6 +136,7 @@ class LabRecorder:
         self.acquisition_manager.start_all()
         
         # Start writer thread
+        self.recording_stopped.clear()
         self.is_recording_flag = True
         self.writer_thread = threading.Thread(target=self._writer_thread_func, daemon=True)
         self.writer_thread.start()
@@ -146,36 +149,40 @@ class LabRecorder:
         if not self.is_recording_flag:
             return
         
-        print("Stopping recording...")
-        self.is_recording_flag = False
+        try:
+            print("Stopping recording...")
+            self.is_recording_flag = False
         
-        # Stop data acquisition
-        self.acquisition_manager.stop_all()
+            # Stop data acquisition
+            self.acquisition_manager.stop_all()
         
-        # Wait for writer thread to finish
-        if self.writer_thread and self.writer_thread.is_alive():
-            self.writer_thread.join(timeout=5.0)
+            # Wait for writer thread to finish
+            if self.writer_thread and self.writer_thread.is_alive():
+                self.writer_thread.join(timeout=5.0)
         
-        # Close LSL inlets
-        for uid, inlet in self.stream_inlets.items():
-            try:
-                inlet.close_stream()
-                stream_name = self.stream_manager.get_stream_info(uid).name()
-                print(f"Closed LSL inlet for stream {stream_name}.")
-            except Exception as e:
-                print(f"Error closing inlet for stream {uid}: {e}")
+            # Close LSL inlets
+            for uid, inlet in self.stream_inlets.items():
+                try:
+                    inlet.close_stream()
+                    stream_name = self.stream_manager.get_stream_info(uid).name()
+                    print(f"Closed LSL inlet for stream {stream_name}.")
+                except Exception as e:
+                    print(f"Error closing inlet for stream {uid}: {e}")
         
-        # Close XDF file
-        if self.xdf_writer:
-            self.xdf_writer.close()
-            self.xdf_writer = None
+            # Close XDF file
+            if self.xdf_writer:
+                self.xdf_writer.close()
+                self.xdf_writer = None
         
-        # Clean up
-        self.stream_inlets.clear()
-        self.stream_ids.clear()
-        self._data_buffers.clear()
+            # Clean up
+            self.stream_inlets.clear()
+            self.stream_ids.clear()
+            self._data_buffers.clear()
         
-        print(f"Recording saved to {self.filename}")
+            print(f"Recording saved to {self.filename}")
+        finally:
+            # Wake anyone waiting for the recording to end (e.g. main's shutdown wait)
+            self.recording_stopped.set()
     
     def start_remote_control_server(self) -> bool:
         """
@@ -0,0 +1,203 @@
+"""
+Parsing helpers for LabRecorder .cfg files.
+"""
+
+import copy
+import functools
+import os
+import re
+import socket
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Tuple
+
+
+_INVALID_FILENAME_CHARS = '<>:"/\\|?*'
+_SANITIZE_TABLE = str.maketrans({c: '-' for c in _INVALID_FILENAME_CHARS})
+# Longer names first so '%datetime' is not matched as '%date'
+_PLACEHOLDER_RE = re.compile(r'%(datetime|date|time|hostname|[mpsbar])')
+# ';' starts a comment anywhere; '#' only at line start or after whitespace,
+# so mid-token '#' (e.g. 'run#1') is kept
+_COMMENT_RE = re.compile(r';|(?:^|\s)#')
+
+_BOOL_MAP = {
+    '0': False, '1': True, 0: False, 1: True,
+    True: True, False: False, 'true': True, 'false': False,
+}
+
+# Parsed .cfg files keyed by (absolute path, mtime); cleared once it grows past the cap
+_PARSE_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+_PARSE_CACHE_MAX = 32
+
+
+def _strip_comment(line: str) -> str:
+    # Remove comments starting with ';' or '#'
+    m = _COMMENT_RE.search(line)
+    return (line[:m.start()] if m else line).strip()
+
+
+def _parse_value(raw: str) -> Any:
+    s = raw.strip()
+    if not s:
+        return ''
+    if '"' in s:
+        items = [item.strip() for item in s.split(',')]
+        cleaned: List[str] = []
+        for item in items:
+            if item.startswith('"') and item.endswith('"') and len(item) >= 2:
+                cleaned.append(item[1:-1])
+            else:
+                cleaned.append(item.strip('"').strip("'"))
+        return cleaned if len(cleaned) != 1 else cleaned[0]
+    if s[0] in '+-.0123456789':
+        # Same shapes as [-+]?\d+ and [-+]?\d*\.\d+; int()/float() alone would
+        # also accept '1_0', '1.5e3' or '1.', which must stay strings
+        digits = s[1:] if s[0] in '+-' else s
+        if digits.isdecimal():
+            return int(s)
+        whole, dot, frac = digits.partition('.')
+        if dot and frac.isdecimal() and (not whole or whole.isdecimal()):
+            return float(s)
+    return s
+
+
+def _as_bool(raw: Any, default: bool) -> bool:
+    """Interpret a parsed .cfg flag (0/1, true/false), falling back to int() and then default."""
+    key = raw.strip().lower() if isinstance(raw, str) else raw
+    try:
+        value = _BOOL_MAP.get(key)
+    except TypeError:  # unhashable, e.g. a quoted list
+        return default
+    if value is not None:
+        return value
+    try:
+        return bool(int(key))
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_cfg_file(path: str) -> Dict[str, Any]:
+    """
+    Parse a LabRecorder .cfg file into a flat key/value dict.
+
+    Keys are lowercased so hand-edited files with varying case still match.
+
+    Results are cached per (path, mtime), so an unchanged file is only parsed once.
+
+    Args:
+        path: Path to the .cfg file
+
+    Returns:
+        Shallow copy of the parsed key/value pairs, keyed by lowercased name
+    """
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return copy.copy(cached)
+
+    cfg: Dict[str, Any] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for raw in f:
+            line = _strip_comment(raw)
+            if not line or '=' not in line:
+                continue
+            name, value = line.split('=', 1)
+            cfg[name.strip().lower()] = _parse_value(value)
+
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+        _PARSE_CACHE.clear()
+    _PARSE_CACHE[key] = cfg
+    return copy.copy(cfg)
+
+
+def _utc_datetime_token(dt: datetime) -> str:
+    """Match C++ Qt format: yyyy-MM-ddTHHmmss.zzzZ (UTC)."""
+    millis = int(dt.microsecond / 1000)
+    return f"{dt.strftime('%Y-%m-%dT%H%M%S')}.{millis:03d}Z"
+
+
+def _utc_date_token(dt: datetime) -> str:
+    """Match C++ Qt format: yyyy-MM-dd (UTC)."""
+    return dt.strftime('%Y-%m-%d')
+
+
+def _utc_time_token(dt: datetime) -> str:
+    """Match C++ Qt format: HHmmss.zzzZ (UTC)."""
+    millis = int(dt.microsecond / 1000)
+    return f"{dt.strftime('%H%M%S')}.{millis:03d}Z"
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_hostname() -> str:
+    """Hostname does not change during the process lifetime; look it up once."""
+    return socket.gethostname()
+
+
+def _expand_template(template: str, placeholders: Dict[str, str]) -> str:
+    return _PLACEHOLDER_RE.sub(lambda m: placeholders.get(m.group(1), m.group(0)), template)
+
+
+def _sanitize_basename(name: str) -> str:
+    if any(c in name for c in _INVALID_FILENAME_CHARS):
+        name = name.translate(_SANITIZE_TABLE)
+    return name.rstrip(' .')
+
+
+def build_filename(cfg: Dict[str, Any], default_filename: str = 'recording.xdf') -> str:
+    """
+    Build the output XDF path from parsed .cfg settings.
+
+    Args:
+        cfg: Parsed .cfg key/value pairs with lowercased keys (see parse_cfg_file)
+        default_filename: Path used when the cfg defines no storage location
+
+    Returns:
+        Output path with placeholders expanded and the basename sanitized
+    """
+    def _s(key: str, default: str = '') -> str:
+        return str(cfg.get(key) or default).strip()
+
+    # Build filename from StudyRoot/StorageLocation/PathTemplate
+    study_root = _s('studyroot')
+    storage_location = _s('storagelocation')
+    path_template = _s('pathtemplate')
+
+    # One UTC snapshot so %date/%time/%datetime always agree
+    now = datetime.now(timezone.utc)
+    hostname = _cached_hostname()
+    placeholders = {
+        'datetime': _utc_datetime_token(now),
+        'date': _utc_date_token(now),
+        'time': _utc_time_token(now),
+        'hostname': hostname,
+        'm': _s('bidsmodality', 'eeg'),
+        'p': _s('participant', 'P001'),
+        's': _s('session', 'S001'),
+        'b': _s('block', 'task'),
+        'a': _s('acq', 'acq'),
+        'r': _s('run', '01'),
+    }
+
+    if storage_location:
+        dest = _expand_template(storage_location, placeholders)
+    elif study_root and path_template:
+        dest = os.path.join(study_root, _expand_template(path_template, placeholders))
+    elif study_root:
+        fname = f"LabRecorder_{hostname}_{placeholders['datetime']}_eeg.xdf"
+        dest = os.path.join(study_root, fname)
+    elif path_template:
+        dest = _expand_template(path_template, placeholders)
+    else:
+        dest = default_filename
+
+    if not dest.lower().endswith('.xdf'):
+        dest = f"{dest}.xdf"
+
+    dir_name, base_name = os.path.split(dest)
+    base_name = _sanitize_basename(base_name)
+    dest = os.path.join(dir_name, base_name)
+    # Only walk the path for '~' / variables when it can contain them
+    if '~' in dest:
+        dest = os.path.expanduser(dest)
+    if '$' in dest or ('%' in dest and os.name == 'nt'):
+        dest = os.path.expandvars(dest)
+    return dest
@@ -4,85 +4,9 @@ Configuration handling for Lab Recorder.
 
 import json
 import os
-import re
-import socket
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 
-
-def _read_cfg_lines(path: str) -> List[str]:
-    with open(path, 'r', encoding='utf-8') as f:
-        return f.readlines()
-
-
-def _strip_comment(line: str) -> str:
-    # Remove comments starting with ';' or '#'
-    for sep in (';', '#'):
-        if sep in line:
-            idx = line.find(sep)
-            if idx >= 0:
-                line = line[:idx]
-    return line.strip()
-
-
-def _parse_value(raw: str) -> Any:
-    s = raw.strip()
-    if not s:
-        return ''
-    if '"' in s:
-        items = [item.strip() for item in s.split(',')]
-        cleaned: List[str] = []
-        for item in items:
-            if item.startswith('"') and item.endswith('"') and len(item) >= 2:
-                cleaned.append(item[1:-1])
-            else:
-                cleaned.append(item.strip('"').strip("'"))
-        return cleaned if len(cleaned) != 1 else cleaned[0]
-    if re.fullmatch(r"[-+]?\d+", s):
-        try:
-            return int(s)
-        except Exception:
-            pass
-    if re.fullmatch(r"[-+]?\d*\.\d+", s):
-        try:
-            return float(s)
-        except Exception:
-            pass
-    if s in ('0', '1'):
-        return int(s)
-    return s
-
-
-def _utc_datetime_token() -> str:
-    """Match C++ Qt format: yyyy-MM-ddTHHmmss.zzzZ (UTC)."""
-    dt = datetime.now(timezone.utc)
-    millis = int(dt.microsecond / 1000)
-    return f"{dt.strftime('%Y-%m-%dT%H%M%S')}.{millis:03d}Z"
-
-
-def _utc_date_token() -> str:
-    """Match C++ Qt format: yyyy-MM-dd (UTC)."""
-    dt = datetime.now(timezone.utc)
-    return dt.strftime('%Y-%m-%d')
-
-
-def _utc_time_token() -> str:
-    """Match C++ Qt format: HHmmss.zzzZ (UTC)."""
-    dt = datetime.now(timezone.utc)
-    millis = int(dt.microsecond / 1000)
-    return f"{dt.strftime('%H%M%S')}.{millis:03d}Z"
-
-
-def _expand_template(template: str, placeholders: Dict[str, str]) -> str:
-    result = template
-    for key, value in placeholders.items():
-        result = result.replace(f'%{key}', value)
-    return result
-
-
-def _sanitize_basename(name: str) -> str:
-    name = re.sub(r'[<>:"/\\|?*]', '-', name)
-    return name.rstrip(' .')
+from ._cfg_parse import _as_bool, build_filename, parse_cfg_file
 
 
 class Config:
@@ -208,63 +132,17 @@ class Config:
         """
         Load settings from a LabRecorder .cfg file and map to Python config.
         """
-        cfg: Dict[str, Any] = {}
-        for raw in _read_cfg_lines(cfg_path):
-            line = _strip_comment(raw)
-            if not line or '=' not in line:
-                continue
-            key, value = line.split('=', 1)
-            cfg[key.strip()] = _parse_value(value)
+        cfg = parse_cfg_file(cfg_path)
 
         # Build filename from StudyRoot/StorageLocation/PathTemplate
-        study_root = str(cfg.get('StudyRoot') or '').strip()
-        storage_location = str(cfg.get('StorageLocation') or '').strip()
-        path_template = str(cfg.get('PathTemplate') or '').strip()
-
-        hostname = socket.gethostname()
-        placeholders = {
-            'datetime': _utc_datetime_token(),
-            'date': _utc_date_token(),
-            'time': _utc_time_token(),
-            'hostname': hostname,
-            'm': str(cfg.get('BidsModality') or 'eeg'),
-            'p': str(cfg.get('Participant') or 'P001'),
-            's': str(cfg.get('Session') or 'S001'),
-            'b': str(cfg.get('Block') or 'task'),
-            'a': str(cfg.get('Acq') or 'acq'),
-            'r': str(cfg.get('Run') or '01'),
-        }
-
-        if storage_location:
-            dest = _expand_template(storage_location, placeholders)
-        elif study_root and path_template:
-            dest = os.path.join(study_root, _expand_template(path_template, placeholders))
-        elif study_root:
-            fname = f"LabRecorder_{hostname}_{placeholders['datetime']}_eeg.xdf"
-            dest = os.path.join(study_root, fname)
-        elif path_template:
-            dest = _expand_template(path_template, placeholders)
-        else:
-            dest = self.config.get('filename', 'recording.xdf')
-
-        if not dest.lower().endswith('.xdf'):
-            dest = f"{dest}.xdf"
-
-        dir_name, base_name = os.path.split(dest)
-        base_name = _sanitize_basename(base_name)
-        dest = os.path.join(dir_name, base_name)
-        dest = os.path.expandvars(os.path.expanduser(dest))
-
-        self.set('filename', dest)
+        self.set('filename', build_filename(cfg, self.config.get('filename', 'recording.xdf')))
 
         # Remote control settings
-        rc_enabled_raw = cfg.get('RCSEnabled')
+        rc_enabled_raw = cfg.get('rcsenabled')
         if rc_enabled_raw is not None:
-            try:
-                self.set('remote_control.enabled', bool(int(rc_enabled_raw)))
-            except Exception:
-                pass
-        rc_port_raw = cfg.get('RCSPort')
+            self.set('remote_control.enabled',
+                     _as_bool(rc_enabled_raw, self.get('remote_control.enabled', True)))
+        rc_port_raw = cfg.get('rcsport')
         if rc_port_raw is not None:
             try:
                 self.set('remote_control.port', int(rc_port_raw))
@@ -272,15 +150,12 @@ class Config:
                 pass
 
         # Auto start (stored but not acted on here)
-        auto_start_raw = cfg.get('AutoStart')
+        auto_start_raw = cfg.get('autostart')
         if auto_start_raw is not None:
-            try:
-                self.set('auto_start', bool(int(auto_start_raw)))
-            except Exception:
-                pass
+            self.set('auto_start', _as_bool(auto_start_raw, self.get('auto_start', False)))
 
         # Required streams (warning responsibility remains with caller)
-        required = cfg.get('RequiredStreams')
+        required = cfg.get('requiredstreams')
         if required is not None:
             if not isinstance(required, list):
                 required_list = [str(required)]
@@ -6,12 +6,35 @@ A cross-platform Python implementation of Lab Streaming Layer (LSL) recorder
 with remote control capabilities.
 """
 
+import os
 import sys
-import time
 import argparse
+import threading
+from typing import Optional
 from labrecorder import LabRecorder
 
 
+def wait_for_shutdown(stop_event: Optional[threading.Event] = None) -> bool:
+    """
+    Block until Ctrl+C is pressed or, if given, stop_event is set.
+
+    Args:
+        stop_event: Optional event that ends the wait (e.g. LabRecorder.recording_stopped)
+
+    Returns:
+        True if the wait ended because of Ctrl+C
+    """
+    event = stop_event if stop_event is not None else threading.Event()
+    # Ctrl+C cannot interrupt a blocking lock wait on Windows, so wake up periodically there
+    timeout = 0.5 if os.name == 'nt' else None
+    try:
+        while not event.wait(timeout):
+            pass
+    except KeyboardInterrupt:
+        return True
+    return False
+
+
 def main():
     """Main entry point for Lab Recorder."""
     # Parse command line arguments
@@ -110,10 +133,7 @@ Examples:
             if enable_remote and not auto_start:
                 print("\nRecorder ready. Use remote control commands to start/stop recording.")
                 print("Or press Ctrl+C to exit.")
-                try:
-                    while True:
-                        time.sleep(1)
-                except KeyboardInterrupt:
+                if wait_for_shutdown():
                     print("\nShutdown requested...")
             else:
                 # Start recording immediately if no remote control
@@ -121,10 +141,7 @@ Examples:
                 recorder.start_recording()
                 
                 print("Recording in progress. Press Ctrl+C to stop.")
-                try:
-                    while recorder.is_recording():
-                        time.sleep(0.5)
-                except KeyboardInterrupt:
+                if wait_for_shutdown(recorder.recording_stopped):
                     print("\nStopping recording...")
                     recorder.stop_recording()
         else:
@@ -134,10 +151,7 @@ Examples:
                 print("1. Start streams and use 'update' command")
                 print("2. Use remote control to manage recording")
                 print("Press Ctrl+C to exit.")
-                try:
-                    while True:
-                        time.sleep(1)
-                except KeyboardInterrupt:
+                if wait_for_shutdown():
                     print("\nShutdown requested...")
             else:
                 print("Exiting...")